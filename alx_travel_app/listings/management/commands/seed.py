@@ -1,12 +1,30 @@
+import os
 import random
 from decimal import Decimal
 from datetime import date, timedelta
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.models import Avg, Count, Q
 from faker import Faker
 from listings.models import Listing, Booking, Review
 
 
+DEFAULT_BATCH_SIZE = 500
+BATCH_SIZE_ENV_VAR = 'SEED_BULK_CREATE_BATCH_SIZE'
+
+# Ratings weighted towards higher scores (5/10/15/35/35), stored as a
+# precomputed CDF so random.choices doesn't re-accumulate the weights
+RATING_VALUES = [1, 2, 3, 4, 5]
+RATING_CUM_WEIGHTS = [5, 15, 30, 65, 100]
+
+# Upper bound on Faker calls per text column; rows sample from the pool
+FAKER_POOL_SIZE = 1000
+
+fake = Faker()
+
+
 class Command(BaseCommand):
     help = 'Seed the database with sample listings, bookings, and reviews data'
 
@@ -33,7 +51,12 @@ class Command(BaseCommand):
             '--reviews',
             type=int,
             default=100,
-            help='Number of reviews to create (default: 100)'
+            help='Number of reviews to create; existing user-property reviews are overwritten (default: 100)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help=f'Number of rows per bulk INSERT (default: ${BATCH_SIZE_ENV_VAR} or {DEFAULT_BATCH_SIZE})'
         )
         parser.add_argument(
             '--clear',
@@ -41,8 +64,48 @@ class Command(BaseCommand):
             help='Clear existing data before seeding'
         )
 
+    def _guest_at(self, user_ids, index, host_id):
+        """Map an index in [0, len(user_ids) - 1) to a user id other than the host's"""
+        # The host's slot is taken by the last user, so each index maps to a
+        # distinct non-host and a uniform index gives a uniform guest.
+        user_id = user_ids[index]
+        if user_id == host_id:
+            return user_ids[-1]
+        return user_id
+
+    def _pick_guest(self, user_ids, host_id):
+        """Pick a random user id other than the host's without building a filtered list"""
+        return self._guest_at(user_ids, random.randrange(len(user_ids) - 1), host_id)
+
+    def _upsert_options(self, unique_fields, update_fields):
+        """bulk_create options that update rows already present on rerun"""
+        options = {'update_conflicts': True, 'update_fields': update_fields}
+        # MySQL/MariaDB upsert on any unique key and reject an explicit target
+        if connection.features.supports_update_conflicts_with_target:
+            options['unique_fields'] = unique_fields
+        return options
+
+    def _get_batch_size(self, batch_size):
+        """Resolve the bulk INSERT batch size from the option or environment"""
+        if batch_size is None:
+            value = os.environ.get(BATCH_SIZE_ENV_VAR, DEFAULT_BATCH_SIZE)
+            try:
+                batch_size = int(value)
+            except ValueError:
+                raise CommandError(f'{BATCH_SIZE_ENV_VAR} must be an integer, got {value!r}.')
+        if batch_size < 1:
+            raise CommandError(f'Batch size must be a positive integer, got {batch_size}.')
+        return batch_size
+
     def handle(self, *args, **options):
-        fake = Faker()
+        """Run the whole seed in one durable transaction"""
+        options['batch_size'] = self._get_batch_size(options['batch_size'])
+        with transaction.atomic(durable=True):
+            self.seed(**options)
+
+    def seed(self, **options):
+        """Seed the database; callers already inside a transaction can use this directly"""
+        batch_size = options['batch_size']
         
         if options['clear']:
             self.stdout.write(self.style.WARNING('Clearing existing data...'))
@@ -58,6 +121,8 @@ class Command(BaseCommand):
         
         if existing_users < users_to_create:
             self.stdout.write(f'Creating {users_to_create - existing_users} users...')
+            # Every seeded user shares a password, so hash it once
+            password = make_password('password123')
             users = []
             for i in range(existing_users, users_to_create):
                 user = User(
@@ -65,15 +130,16 @@ class Command(BaseCommand):
                     email=fake.email(),
                     first_name=fake.first_name(),
                     last_name=fake.last_name(),
+                    password=password,
                     is_active=True
                 )
-                user.set_password('password123')
                 users.append(user)
             
-            User.objects.bulk_create(users, ignore_conflicts=True)
+            User.objects.bulk_create(users, ignore_conflicts=True, batch_size=batch_size)
             self.stdout.write(self.style.SUCCESS(f'Created {len(users)} users.'))
         
-        all_users = list(User.objects.all()[:users_to_create])
+        # Only the primary key is needed to attach users to generated rows
+        user_ids = list(User.objects.values_list('id', flat=True)[:users_to_create])
 
         # Create listings
         listings_count = options['listings']
@@ -110,57 +176,81 @@ class Command(BaseCommand):
             'Boston, MA'
         ]
 
+        # Draw every fixed-choice column in one call instead of once per row
+        host_ids = random.choices(user_ids, k=listings_count)
+        names = random.choices(property_types, k=listings_count)
+        pool_size = min(FAKER_POOL_SIZE, listings_count)
+        descriptions = random.choices(fake.texts(nb_texts=pool_size, max_nb_chars=500), k=listings_count)
+        cities = random.choices([fake.city() for _ in range(pool_size)], k=listings_count)
+        listing_locations = random.choices(locations, k=listings_count)
+        price_cents = random.choices(range(5000, 50001), k=listings_count)  # $50.00 to $500.00
+        bedrooms = random.choices(range(1, 6), k=listings_count)
+        bathrooms = random.choices(range(1, 5), k=listings_count)
+        max_guests = random.choices(range(1, 11), k=listings_count)
+        availability = random.choices([True, False], cum_weights=[3, 4], k=listings_count)  # 75% available
+
+        # created_at/updated_at are left to auto_now_add/auto_now: bulk_create
+        # runs their pre_save hooks, which overwrite any value passed here.
         listings = []
-        for _ in range(listings_count):
+        for i in range(listings_count):
             listing = Listing(
-                host=random.choice(all_users),
-                name=f"{random.choice(property_types)} in {fake.city()}",
-                description=fake.text(max_nb_chars=500),
-                location=random.choice(locations),
-                price_per_night=Decimal(str(random.uniform(50, 500))).quantize(Decimal('0.01')),
-                bedrooms=random.randint(1, 5),
-                bathrooms=random.randint(1, 4),
-                max_guests=random.randint(1, 10),
-                is_available=random.choice([True, True, True, False])  # 75% available
+                host_id=host_ids[i],
+                name=f"{names[i]} in {cities[i]}",
+                description=descriptions[i],
+                location=listing_locations[i],
+                price_per_night=Decimal(price_cents[i]).scaleb(-2),
+                bedrooms=bedrooms[i],
+                bathrooms=bathrooms[i],
+                max_guests=max_guests[i],
+                is_available=availability[i]
             )
             listings.append(listing)
         
-        Listing.objects.bulk_create(listings)
+        Listing.objects.bulk_create(listings, batch_size=batch_size)
         self.stdout.write(self.style.SUCCESS(f'Created {len(listings)} listings.'))
         
-        all_listings = list(Listing.objects.all())
+        # Skip the description and other columns bookings/reviews never read
+        all_listings = list(
+            Listing.objects.only('listing_id', 'host_id', 'price_per_night', 'max_guests')
+        )
 
         # Create bookings
         bookings_count = options['bookings']
         self.stdout.write(f'Creating {bookings_count} bookings...')
         
         booking_statuses = ['pending', 'confirmed', 'canceled', 'completed']
+        booking_listings = random.choices(all_listings, k=bookings_count)
+        durations = random.choices(range(1, 15), k=bookings_count)  # 1 to 14 days
+        statuses = random.choices(booking_statuses, k=bookings_count)
+        # Check-in within roughly six months either side of today
+        today = date.today()
+        start_offsets = random.choices(range(-180, 181), k=bookings_count)
         bookings = []
         
-        for _ in range(bookings_count):
-            listing = random.choice(all_listings)
-            user = random.choice([u for u in all_users if u != listing.host])  # Guest can't be host
+        for i in range(bookings_count):
+            listing = booking_listings[i]
+            user_id = self._pick_guest(user_ids, listing.host_id)  # Guest can't be host
             
             # Generate random dates
-            start_date = fake.date_between(start_date='-6m', end_date='+6m')
-            duration = random.randint(1, 14)  # 1 to 14 days
+            start_date = today + timedelta(days=start_offsets[i])
+            duration = durations[i]
             end_date = start_date + timedelta(days=duration)
             
             guests = random.randint(1, min(listing.max_guests, 6))
             total_price = duration * listing.price_per_night
             
             booking = Booking(
-                property=listing,
-                user=user,
+                property_id=listing.listing_id,
+                user_id=user_id,
                 check_in_date=start_date,
                 check_out_date=end_date,
                 guests=guests,
                 total_price=total_price,
-                status=random.choice(booking_statuses)
+                status=statuses[i]
             )
             bookings.append(booking)
         
-        Booking.objects.bulk_create(bookings)
+        Booking.objects.bulk_create(bookings, batch_size=batch_size)
         self.stdout.write(self.style.SUCCESS(f'Created {len(bookings)} bookings.'))
 
         # Create reviews
@@ -185,54 +275,69 @@ class Command(BaseCommand):
             "Comfortable bed and great wifi."
         ]
         
+        ratings = random.choices(RATING_VALUES, cum_weights=RATING_CUM_WEIGHTS, k=reviews_count)
+        comments = random.choices(review_comments, k=reviews_count)
+        # Sample distinct (listing, guest) slots straight from the index space,
+        # so every review is a unique user-property pair without retries
+        guests_per_listing = max(len(user_ids) - 1, 0)
+        total_pairs = len(all_listings) * guests_per_listing
+        slots = random.sample(range(total_pairs), min(reviews_count, total_pairs))
         reviews = []
-        user_property_pairs = set()
         
-        attempts = 0
-        while len(reviews) < reviews_count and attempts < reviews_count * 3:
-            attempts += 1
-            listing = random.choice(all_listings)
-            user = random.choice([u for u in all_users if u != listing.host])
-            
-            # Ensure unique user-property combination
-            pair = (user.id, listing.listing_id)
-            if pair in user_property_pairs:
-                continue
-                
-            user_property_pairs.add(pair)
+        for i, slot in enumerate(slots):
+            listing_index, guest_index = divmod(slot, guests_per_listing)
+            listing = all_listings[listing_index]
+            user_id = self._guest_at(user_ids, guest_index, listing.host_id)
             
             review = Review(
-                property=listing,
-                user=user,
-                rating=random.choices(
-                    [1, 2, 3, 4, 5],
-                    weights=[5, 10, 15, 35, 35]  # Weighted towards higher ratings
-                )[0],
-                comment=random.choice(review_comments)
+                property_id=listing.listing_id,
+                user_id=user_id,
+                rating=ratings[i],
+                comment=comments[i]
             )
             reviews.append(review)
         
-        Review.objects.bulk_create(reviews)
-        self.stdout.write(self.style.SUCCESS(f'Created {len(reviews)} reviews.'))
+        # A rerun without --clear can sample a user-property pair that
+        # already has a review, so overwrite its rating and comment instead
+        # of failing; the row count tells new reviews from refreshed ones.
+        existing_reviews = Review.objects.count()
+        Review.objects.bulk_create(
+            reviews,
+            batch_size=batch_size,
+            **self._upsert_options(['property', 'user'], ['rating', 'comment', 'updated_at'])
+        )
+        created_reviews = Review.objects.count() - existing_reviews
+        updated_reviews = len(reviews) - created_reviews
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {created_reviews} reviews, updated {updated_reviews} existing reviews.'
+        ))
+
+        # Summary: one aggregate query per model
+        listing_stats = Listing.objects.aggregate(
+            total=Count('listing_id'),
+            available=Count('listing_id', filter=Q(is_available=True))
+        )
+        booking_stats = Booking.objects.aggregate(
+            total=Count('booking_id'),
+            confirmed=Count('booking_id', filter=Q(status='confirmed'))
+        )
+        review_stats = Review.objects.aggregate(
+            total=Count('review_id'),
+            avg_rating=Avg('rating')
+        )
 
-        # Summary
         self.stdout.write(self.style.SUCCESS('\n=== SEEDING COMPLETED ==='))
         self.stdout.write(f'Users: {User.objects.count()}')
-        self.stdout.write(f'Listings: {Listing.objects.count()}')
-        self.stdout.write(f'Bookings: {Booking.objects.count()}')
-        self.stdout.write(f'Reviews: {Review.objects.count()}')
+        self.stdout.write(f'Listings: {listing_stats["total"]}')
+        self.stdout.write(f'Bookings: {booking_stats["total"]}')
+        self.stdout.write(f'Reviews: {review_stats["total"]}')
         
         # Show some statistics
         self.stdout.write('\n=== STATISTICS ===')
-        available_listings = Listing.objects.filter(is_available=True).count()
-        self.stdout.write(f'Available listings: {available_listings}')
-        
-        confirmed_bookings = Booking.objects.filter(status='confirmed').count()
-        self.stdout.write(f'Confirmed bookings: {confirmed_bookings}')
+        self.stdout.write(f'Available listings: {listing_stats["available"]}')
+        self.stdout.write(f'Confirmed bookings: {booking_stats["confirmed"]}')
         
-        avg_rating = Review.objects.aggregate(
-            avg_rating=models.Avg('rating')
-        )['avg_rating']
+        avg_rating = review_stats['avg_rating']
         if avg_rating:
             self.stdout.write(f'Average rating: {avg_rating:.2f}')
         
@@ -0,0 +1,82 @@
+# Generated by Django 5.2.4 on 2026-10-14 09:04
+
+import django.core.validators
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Listing',
+            fields=[
+                ('listing_id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='Unique identifier for the listing', primary_key=True, serialize=False)),
+                ('name', models.CharField(help_text='Title/name of the listing', max_length=200)),
+                ('description', models.TextField(help_text='Detailed description of the property')),
+                ('location', models.CharField(help_text='Address or location of the property', max_length=200)),
+                ('price_per_night', models.DecimalField(decimal_places=2, help_text='Price per night in USD', max_digits=10, validators=[django.core.validators.MinValueValidator(0)])),
+                ('bedrooms', models.PositiveIntegerField(default=1, help_text='Number of bedrooms')),
+                ('bathrooms', models.PositiveIntegerField(default=1, help_text='Number of bathrooms')),
+                ('max_guests', models.PositiveIntegerField(default=2, help_text='Maximum number of guests allowed')),
+                ('is_available', models.BooleanField(db_index=True, default=True, help_text='Whether the listing is available for booking')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='When the listing was created')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='When the listing was last updated')),
+                ('host', models.ForeignKey(help_text='The user who owns this listing', on_delete=django.db.models.deletion.CASCADE, related_name='listings', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Property Listing',
+                'verbose_name_plural': 'Property Listings',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Booking',
+            fields=[
+                ('booking_id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='Unique identifier for the booking', primary_key=True, serialize=False)),
+                ('check_in_date', models.DateField(help_text='Check-in date')),
+                ('check_out_date', models.DateField(help_text='Check-out date')),
+                ('guests', models.PositiveIntegerField(default=1, help_text='Number of guests')),
+                ('total_price', models.DecimalField(decimal_places=2, help_text='Total price for the entire stay', max_digits=10, validators=[django.core.validators.MinValueValidator(0)])),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('confirmed', 'Confirmed'), ('canceled', 'Canceled'), ('completed', 'Completed')], default='pending', help_text='Current status of the booking', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='When the booking was created')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='When the booking was last updated')),
+                ('user', models.ForeignKey(help_text='The user making the booking', on_delete=django.db.models.deletion.CASCADE, related_name='bookings', to=settings.AUTH_USER_MODEL)),
+                ('property', models.ForeignKey(help_text='The property being booked', on_delete=django.db.models.deletion.CASCADE, related_name='bookings', to='listings.listing')),
+            ],
+            options={
+                'verbose_name': 'Booking',
+                'verbose_name_plural': 'Bookings',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'check_in_date'], name='booking_status_check_in_idx'), models.Index(fields=['property', 'check_in_date', 'check_out_date'], name='booking_property_dates_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('check_out_date__gt', models.F('check_in_date'))), name='check_out_after_check_in')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Review',
+            fields=[
+                ('review_id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='Unique identifier for the review', primary_key=True, serialize=False)),
+                ('rating', models.PositiveIntegerField(help_text='Rating from 1 to 5 stars', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('comment', models.TextField(help_text='Written review comment')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='When the review was created')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='When the review was last updated')),
+                ('property', models.ForeignKey(help_text='The property being reviewed', on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='listings.listing')),
+                ('user', models.ForeignKey(help_text='The user writing the review', on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Review',
+                'verbose_name_plural': 'Reviews',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['property', 'rating'], name='review_property_rating_idx')],
+                'unique_together': {('property', 'user')},
+            },
+        ),
+    ]
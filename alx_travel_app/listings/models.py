@@ -1,9 +1,50 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.db.models.functions import Coalesce
 import uuid
 
 
+class ListingQuerySet(models.QuerySet):
+    """
+    QuerySet for listings with helpers for list/detail API querysets.
+    """
+    def with_review_stats(self):
+        """Annotate each listing with its average rating and review count"""
+        return self.annotate(
+            average_rating=Coalesce(models.Avg('reviews__rating'), models.Value(0.0)),
+            total_reviews=models.Count('reviews'),
+        )
+
+    def with_related(self):
+        """Eager-load the host and each review's user for nested serializers"""
+        # Limit review columns to what ReviewSerializer/UserSerializer render;
+        # a deferred field they read would cost one query per review.
+        reviews = Review.objects.select_related('user').only(
+            'review_id', 'property_id', 'rating', 'comment', 'created_at', 'updated_at',
+            'user__id', 'user__username', 'user__first_name', 'user__last_name', 'user__email',
+        )
+        return self.select_related('host').prefetch_related(
+            models.Prefetch('reviews', queryset=reviews)
+        )
+
+
+class BookingQuerySet(models.QuerySet):
+    """
+    QuerySet for bookings with helpers for list/detail API querysets.
+    """
+    def with_related(self):
+        """Eager-load the property, its host and the guest for nested serializers"""
+        # The property is prefetched rather than joined so it carries the
+        # review stats that ListingSummarySerializer reads.
+        return self.select_related('user').prefetch_related(
+            models.Prefetch(
+                'property',
+                queryset=Listing.objects.select_related('host').with_review_stats()
+            )
+        )
+
+
 class Listing(models.Model):
     """
     Model representing a property listing for travel accommodations.
@@ -62,6 +103,7 @@ class Listing(models.Model):
     # Availability and status
     is_available = models.BooleanField(
         default=True,
+        db_index=True,
         help_text="Whether the listing is available for booking"
     )
     
@@ -76,6 +118,8 @@ class Listing(models.Model):
         help_text="When the listing was last updated"
     )
 
+    objects = ListingQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Property Listing"
@@ -86,10 +130,7 @@ class Listing(models.Model):
 
     def get_average_rating(self):
         """Calculate the average rating from all reviews"""
-        reviews = self.reviews.all()
-        if reviews:
-            return reviews.aggregate(models.Avg('rating'))['rating__avg']
-        return 0
+        return self.reviews.aggregate(models.Avg('rating'))['rating__avg'] or 0
 
     def get_total_reviews(self):
         """Get the total number of reviews"""
@@ -166,10 +207,20 @@ class Booking(models.Model):
         help_text="When the booking was last updated"
     )
 
+    objects = BookingQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Booking"
         verbose_name_plural = "Bookings"
+        indexes = [
+            models.Index(fields=['status', 'check_in_date'], name='booking_status_check_in_idx'),
+            # Covers availability/overlap lookups for a property's date range
+            models.Index(
+                fields=['property', 'check_in_date', 'check_out_date'],
+                name='booking_property_dates_idx'
+            ),
+        ]
         # Ensure no double bookings for the same property and dates
         constraints = [
             models.CheckConstraint(
@@ -188,18 +239,26 @@ class Booking(models.Model):
         if self.check_out_date <= self.check_in_date:
             raise ValidationError("Check-out date must be after check-in date.")
         
-        if self.guests > self.property.max_guests:
-            raise ValidationError(f"Number of guests exceeds maximum capacity of {self.property.max_guests}.")
+        if self.property_id:
+            max_guests = self._get_property_value('max_guests')
+            if self.guests > max_guests:
+                raise ValidationError(f"Number of guests exceeds maximum capacity of {max_guests}.")
 
     def get_duration_days(self):
         """Calculate the duration of the stay in days"""
         return (self.check_out_date - self.check_in_date).days
 
+    def _get_property_value(self, field_name):
+        """Read a property field, fetching only that column if the property isn't cached"""
+        if self._meta.get_field('property').is_cached(self):
+            return getattr(self.property, field_name)
+        return Listing.objects.values_list(field_name, flat=True).get(pk=self.property_id)
+
     def save(self, *args, **kwargs):
         """Override save to calculate total price"""
-        if self.check_in_date and self.check_out_date and self.property:
+        if self.check_in_date and self.check_out_date and self.property_id:
             duration = self.get_duration_days()
-            self.total_price = duration * self.property.price_per_night
+            self.total_price = duration * self._get_property_value('price_per_night')
         super().save(*args, **kwargs)
 
 
@@ -254,6 +313,10 @@ class Review(models.Model):
         verbose_name_plural = "Reviews"
         # Ensure one review per user per property
         unique_together = ['property', 'user']
+        indexes = [
+            # Lets per-listing rating aggregates read ratings from the index
+            models.Index(fields=['property', 'rating'], name='review_property_rating_idx'),
+        ]
 
     def __str__(self):
         return f"Review by {self.user.username} - {self.rating} stars"
\ No newline at end of file
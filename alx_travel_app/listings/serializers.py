@@ -35,14 +35,33 @@ class ReviewSerializer(serializers.ModelSerializer):
         return value
 
 
-class ListingSerializer(serializers.ModelSerializer):
+class ReviewStatsMixin(serializers.Serializer):
+    """
+    Adds average_rating and total_reviews to Listing serializers, read from the
+    with_review_stats() annotations when present and the model methods otherwise.
+    """
+    average_rating = serializers.SerializerMethodField()
+    total_reviews = serializers.SerializerMethodField()
+
+    def get_average_rating(self, obj):
+        """Get the average rating, using the with_review_stats() annotation if present"""
+        if hasattr(obj, 'average_rating'):
+            return obj.average_rating
+        return obj.get_average_rating()
+
+    def get_total_reviews(self, obj):
+        """Get the total number of reviews, using the with_review_stats() annotation if present"""
+        if hasattr(obj, 'total_reviews'):
+            return obj.total_reviews
+        return obj.get_total_reviews()
+
+
+class ListingSerializer(ReviewStatsMixin, serializers.ModelSerializer):
     """
     Serializer for Listing model with nested host information and review statistics.
     """
     host = UserSerializer(read_only=True)
     host_id = serializers.IntegerField(write_only=True)
-    average_rating = serializers.SerializerMethodField()
-    total_reviews = serializers.SerializerMethodField()
     reviews = ReviewSerializer(many=True, read_only=True)
     
     class Meta:
@@ -55,14 +74,6 @@ class ListingSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['listing_id', 'created_at', 'updated_at']
 
-    def get_average_rating(self, obj):
-        """Get the average rating for the listing"""
-        return obj.get_average_rating()
-
-    def get_total_reviews(self, obj):
-        """Get the total number of reviews for the listing"""
-        return obj.get_total_reviews()
-
     def validate_price_per_night(self, value):
         """Validate price is positive"""
         if value <= 0:
@@ -83,13 +94,11 @@ class ListingDetailSerializer(ListingSerializer):
     reviews = ReviewSerializer(many=True, read_only=True)
 
 
-class ListingSummarySerializer(serializers.ModelSerializer):
+class ListingSummarySerializer(ReviewStatsMixin, serializers.ModelSerializer):
     """
     Simplified serializer for Listing for list views.
     """
     host_name = serializers.CharField(source='host.username', read_only=True)
-    average_rating = serializers.SerializerMethodField()
-    total_reviews = serializers.SerializerMethodField()
     
     class Meta:
         model = Listing
@@ -99,14 +108,6 @@ class ListingSummarySerializer(serializers.ModelSerializer):
             'host_name', 'average_rating', 'total_reviews'
         ]
 
-    def get_average_rating(self, obj):
-        """Get the average rating for the listing"""
-        return obj.get_average_rating()
-
-    def get_total_reviews(self, obj):
-        """Get the total number of reviews for the listing"""
-        return obj.get_total_reviews()
-
 
 class BookingSerializer(serializers.ModelSerializer):
     """
@@ -146,27 +147,36 @@ class BookingSerializer(serializers.ModelSerializer):
                 })
 
         # Validate guest capacity
-        if property_obj and guests:
+        if property_obj:
             try:
-                listing = Listing.objects.get(listing_id=property_obj)
-                if guests > listing.max_guests:
-                    raise serializers.ValidationError({
-                        'guests': f'Number of guests exceeds maximum capacity of {listing.max_guests}.'
-                    })
+                # Load the full row: the response renders it through ListingSummarySerializer
+                listing = Listing.objects.select_related('host').with_review_stats().get(
+                    listing_id=property_obj
+                )
             except Listing.DoesNotExist:
                 raise serializers.ValidationError({
                     'property_id': 'Invalid property ID.'
                 })
+            if guests and guests > listing.max_guests:
+                raise serializers.ValidationError({
+                    'guests': f'Number of guests exceeds maximum capacity of {listing.max_guests}.'
+                })
+            # Hand the listing to create() so it isn't fetched again
+            data['property'] = listing
 
         return data
 
     def create(self, validated_data):
         """Create booking and calculate total price"""
+        property_obj = validated_data.pop('property', None)
         property_id = validated_data.pop('property_id')
         user_id = validated_data.pop('user_id')
         
         try:
-            property_obj = Listing.objects.get(listing_id=property_id)
+            if property_obj is None:
+                property_obj = Listing.objects.select_related('host').with_review_stats().get(
+                    listing_id=property_id
+                )
             user_obj = User.objects.get(id=user_id)
         except (Listing.DoesNotExist, User.DoesNotExist) as e:
             raise serializers.ValidationError(f"Invalid reference: {str(e)}")
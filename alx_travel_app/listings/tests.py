@@ -1,3 +1,156 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Listing, Review
+from .serializers import BookingSerializer, ListingSerializer, ListingSummarySerializer
+
+
+class SeedCommandTests(TestCase):
+    """
+    Tests for the seed management command.
+    """
+    def seed(self, **options):
+        """Run the seed command quietly with the given counts"""
+        defaults = {'users': 4, 'listings': 3, 'bookings': 0, 'reviews': 0}
+        defaults.update(options)
+        call_command('seed', stdout=StringIO(), **defaults)
+
+    def assert_valid_reviews(self, expected_count):
+        """Check review pairs are distinct, never by the host, and fully counted"""
+        reviews = list(Review.objects.values_list('property_id', 'user_id', 'property__host_id'))
+        pairs = {(property_id, user_id) for property_id, user_id, _ in reviews}
+
+        self.assertEqual(len(reviews), expected_count)
+        self.assertEqual(len(pairs), len(reviews))
+        for _, user_id, host_id in reviews:
+            self.assertNotEqual(user_id, host_id)
+
+    def test_reviews_capped_by_available_pairs(self):
+        """Asking for more reviews than valid pairs creates every pair once"""
+        self.seed(users=4, listings=3, reviews=50)
+
+        self.assertEqual(Listing.objects.count(), 3)
+        self.assert_valid_reviews(min(50, 3 * (4 - 1)))
+
+    def test_reviews_below_available_pairs(self):
+        """Asking for fewer reviews than valid pairs creates exactly that many"""
+        self.seed(users=5, listings=6, reviews=10)
+
+        self.assert_valid_reviews(min(10, 6 * (5 - 1)))
+
+    def test_rerun_reports_updated_reviews(self):
+        """A rerun without --clear overwrites existing reviews and reports them apart"""
+        self.seed(users=2, listings=1, reviews=1)
+        review = Review.objects.get()
+
+        out = StringIO()
+        call_command('seed', users=2, listings=0, bookings=0, reviews=1, stdout=out)
+
+        self.assertIn('Created 0 reviews, updated 1 existing reviews.', out.getvalue())
+        self.assertEqual(Review.objects.get().pk, review.pk)
+
+    def test_rejects_non_positive_batch_size(self):
+        """A zero or negative --batch-size fails before anything is written"""
+        for batch_size in (0, -5):
+            with self.assertRaisesMessage(CommandError, 'Batch size must be a positive integer'):
+                self.seed(batch_size=batch_size)
+        self.assertFalse(Listing.objects.exists())
+
+    def test_rejects_non_integer_batch_size_env(self):
+        """A non-integer SEED_BULK_CREATE_BATCH_SIZE raises a CommandError"""
+        with mock.patch.dict('os.environ', {'SEED_BULK_CREATE_BATCH_SIZE': 'lots'}):
+            with self.assertRaisesMessage(CommandError, 'SEED_BULK_CREATE_BATCH_SIZE must be an integer'):
+                self.seed()
+
+
+class ListingFixtureTestCase(TestCase):
+    """
+    Base test case with a host, a guest and one of the host's listings.
+    """
+    def setUp(self):
+        self.host = User.objects.create_user(username='host', password='password123')
+        self.guest = User.objects.create_user(username='guest', password='password123')
+        self.listing = Listing.objects.create(
+            host=self.host,
+            name='Beachfront Condo',
+            description='Steps from the sand.',
+            location='Miami, FL',
+            price_per_night=Decimal('120.00'),
+            max_guests=4,
+        )
+
+
+class BookingSerializerTests(ListingFixtureTestCase):
+    """
+    Tests for BookingSerializer create and response rendering.
+    """
+    def booking_data(self, **overrides):
+        """Build a valid booking payload"""
+        data = {
+            'property_id': str(self.listing.listing_id),
+            'user_id': self.guest.id,
+            'check_in_date': date(2026, 1, 10),
+            'check_out_date': date(2026, 1, 13),
+            'guests': 2,
+        }
+        data.update(overrides)
+        return data
+
+    def test_create_and_render_query_count(self):
+        """Creating a booking and rendering it loads the listing only once"""
+        serializer = BookingSerializer(data=self.booking_data())
+
+        # Listing (with host and review stats), user, booking insert
+        with self.assertNumQueries(3):
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+            booking = serializer.save()
+            data = serializer.data
+
+        self.assertEqual(booking.total_price, Decimal('360.00'))
+        self.assertEqual(data['property']['host_name'], 'host')
+        self.assertEqual(data['property']['average_rating'], 0)
+        self.assertEqual(data['property']['total_reviews'], 0)
+
+
+class ListingReviewStatsTests(ListingFixtureTestCase):
+    """
+    Tests that listing serializers always render review statistics.
+    """
+    def test_stats_without_annotation(self):
+        """Listings loaded without with_review_stats() still report both fields"""
+        for serializer_class in (ListingSerializer, ListingSummarySerializer):
+            data = serializer_class(self.listing).data
+            self.assertEqual(data['average_rating'], 0)
+            self.assertEqual(data['total_reviews'], 0)
+
+    def test_stats_match_annotation(self):
+        """Annotated and plain listings render the same statistics"""
+        Review.objects.create(property=self.listing, user=self.guest, rating=4, comment='Cosy.')
+        annotated = Listing.objects.with_review_stats().get(pk=self.listing.pk)
+
+        for serializer_class in (ListingSerializer, ListingSummarySerializer):
+            for listing in (self.listing, annotated):
+                data = serializer_class(listing).data
+                self.assertEqual(data['average_rating'], 4)
+                self.assertEqual(data['total_reviews'], 1)
+
+    def test_create_response_includes_stats(self):
+        """The ListingSerializer create response includes both fields"""
+        serializer = ListingSerializer(data={
+            'host_id': self.host.id,
+            'name': 'Historic Townhouse',
+            'description': 'Close to the old town.',
+            'location': 'Rome, Italy',
+            'price_per_night': '150.00',
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+
+        self.assertEqual(serializer.data['average_rating'], 0)
+        self.assertEqual(serializer.data['total_reviews'], 0)